@@ -132,6 +132,8 @@ ARP_CACHE_UPDATE_FROM_GRATUITIOUS_REPLY = True
 # ICMPv6 ND cache configuration
 ND_CACHE_ENTRY_MAX_AGE = 3600
 ND_CACHE_ENTRY_REFRESH_TIME = 300
+# Minimum interval (in seconds) between Neighbor Solicitations sent for the same target
+ND_CACHE_NS_HOLD_TIME = 1
 
 # TCP/UDP ephemeral port range to be used by outbound connections
 EPHEMERAL_PORT_RANGE = range(32168, 60700, 2)
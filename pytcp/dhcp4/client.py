@@ -32,6 +32,7 @@
 from __future__ import annotations
 
 import random
+import time
 from typing import TYPE_CHECKING
 
 import dhcp4.ps
@@ -40,9 +41,20 @@ from lib.ip4_address import Ip4Address
 from lib.logger import log
 
 if TYPE_CHECKING:
+    from typing import Any
+
     from lib.mac_address import MacAddress
 
 
+# Immutable field values shared by all outbound packets, Dhcp4OptParamReqList only reads the request list when serializing it
+_ZERO_IP4 = Ip4Address("0.0.0.0")
+_PRL = (dhcp4.ps.DHCP4_OPT_SUBNET_MASK, dhcp4.ps.DHCP4_OPT_ROUTER)
+_HOST = "PyTCP"
+
+# Time (in seconds) client waits for server's reply to each of its messages
+_REPLY_TIMEOUT = 5
+
+
 class Dhcp4Client:
     """Class supporting Dhc4 client operation"""
 
@@ -50,47 +62,86 @@ class Dhcp4Client:
         """Class constructor"""
 
         self._mac_address = mac_address
+        self._chaddr = bytes(mac_address)
+        self._socket: socket.Socket | None = None
+
+    def _flush_socket(self, s: socket.Socket) -> None:
+        """Discard datagrams and unreachable notification left on reused socket by previous transaction"""
+
+        while True:
+            try:
+                if s.recv_or_none(timeout=0) is None:
+                    return
+            except ConnectionRefusedError:
+                pass
+
+    def _recv_reply(self, s: socket.Socket, dhcp_xid: int, msg_name: str) -> dhcp4.ps.Dhcp4Packet | None:
+        """Wait for server's reply matching transaction id, replies to other transactions are skipped until deadline"""
+
+        deadline = time.monotonic() + _REPLY_TIMEOUT
+        while (timeout := deadline - time.monotonic()) > 0:
+            if (data_rx := s.recv_or_none(timeout=timeout)) is None:
+                break
+            dhcp_packet_rx = dhcp4.ps.Dhcp4Packet(data_rx)
+            if dhcp_packet_rx.dhcp_xid == dhcp_xid:
+                return dhcp_packet_rx
+            if __debug__:
+                log("dhcp4", f"Skipped DHCP {msg_name} candidate message - transaction id mismatch")
+        if __debug__:
+            log("dhcp4", f"Didn't receive DHCP {msg_name} message - timeout")
+        return None
+
+    def close(self) -> None:
+        """Close client's socket"""
+
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
 
     def fetch(self) -> tuple[str, str | None] | tuple[None, None]:
         """IPv4 DHCP client"""
 
-        s = socket.socket(family=socket.AF_INET4, type=socket.SOCK_DGRAM)
-        s.bind(("0.0.0.0", 68))
-        s.connect(("255.255.255.255", 67))
+        # Socket is created on first use and kept for subsequent transactions (retries) until client is closed,
+        # it is stored only once fully set up so failed setup gets retried by next call
+        if (s := self._socket) is None:
+            s = socket.socket(family=socket.AF_INET4, type=socket.SOCK_DGRAM)
+            try:
+                s.bind(("0.0.0.0", 68))
+                s.connect(("255.255.255.255", 67))
+            except Exception:
+                s.close()
+                raise
+            self._socket = s
+        else:
+            self._flush_socket(s)
 
         dhcp_xid = random.randint(0, 0xFFFFFFFF)
 
-        # Send DHCP Discover
-        s.send(
-            dhcp4.ps.Dhcp4Packet(
-                dhcp_op=dhcp4.ps.DHCP4_OP_REQUEST,
-                dhcp_xid=dhcp_xid,
-                dhcp_ciaddr=Ip4Address("0.0.0.0"),
-                dhcp_yiaddr=Ip4Address("0.0.0.0"),
-                dhcp_siaddr=Ip4Address("0.0.0.0"),
-                dhcp_giaddr=Ip4Address("0.0.0.0"),
-                dhcp_chaddr=bytes(self._mac_address),
-                dhcp_msg_type=dhcp4.ps.DHCP4_MSG_DISCOVER,
-                dhcp_param_req_list=[dhcp4.ps.DHCP4_OPT_SUBNET_MASK, dhcp4.ps.DHCP4_OPT_ROUTER],
-                dhcp_host_name="PyTCP",
-            ).raw_packet
+        # Fields shared by Discover and Request messages
+        common: dict[str, Any] = dict(
+            dhcp_op=dhcp4.ps.DHCP4_OP_REQUEST,
+            dhcp_xid=dhcp_xid,
+            dhcp_ciaddr=_ZERO_IP4,
+            dhcp_yiaddr=_ZERO_IP4,
+            dhcp_siaddr=_ZERO_IP4,
+            dhcp_giaddr=_ZERO_IP4,
+            dhcp_chaddr=self._chaddr,
+            dhcp_param_req_list=_PRL,
+            dhcp_host_name=_HOST,
         )
+
+        # Send DHCP Discover
+        s.send(dhcp4.ps.Dhcp4Packet(**common, dhcp_msg_type=dhcp4.ps.DHCP4_MSG_DISCOVER).raw_packet)
         if __debug__:
             log("dhcp4", "Sent out DHCP Discover message")
 
         # Wait for DHCP Offer
-        try:
-            dhcp_packet_rx = dhcp4.ps.Dhcp4Packet(s.recv(timeout=5))
-        except socket.ReceiveTimeout:
-            if __debug__:
-                log("dhcp4", "Didn't receive DHCP Offer message - timeout")
-            s.close()
+        if (dhcp_packet_rx := self._recv_reply(s, dhcp_xid, "Offer")) is None:
             return None, None
 
         if dhcp_packet_rx.dhcp_msg_type != dhcp4.ps.DHCP4_MSG_OFFER:
             if __debug__:
                 log("dhcp4", "Didn't receive DHCP Offer message - message type error")
-            s.close()
             return None, None
 
         dhcp_srv_id = dhcp_packet_rx.dhcp_srv_id
@@ -104,39 +155,18 @@ class Dhcp4Client:
             )
 
         # Send DHCP Request
-        s.send(
-            dhcp4.ps.Dhcp4Packet(
-                dhcp_op=dhcp4.ps.DHCP4_OP_REQUEST,
-                dhcp_xid=dhcp_xid,
-                dhcp_ciaddr=Ip4Address("0.0.0.0"),
-                dhcp_yiaddr=Ip4Address("0.0.0.0"),
-                dhcp_siaddr=Ip4Address("0.0.0.0"),
-                dhcp_giaddr=Ip4Address("0.0.0.0"),
-                dhcp_chaddr=bytes(self._mac_address),
-                dhcp_msg_type=dhcp4.ps.DHCP4_MSG_REQUEST,
-                dhcp_srv_id=dhcp_srv_id,
-                dhcp_req_ip_addr=dhcp_yiaddr,
-                dhcp_param_req_list=[dhcp4.ps.DHCP4_OPT_SUBNET_MASK, dhcp4.ps.DHCP4_OPT_ROUTER],
-                dhcp_host_name="PyTCP",
-            ).raw_packet
-        )
+        s.send(dhcp4.ps.Dhcp4Packet(**common, dhcp_msg_type=dhcp4.ps.DHCP4_MSG_REQUEST, dhcp_srv_id=dhcp_srv_id, dhcp_req_ip_addr=dhcp_yiaddr).raw_packet)
 
         if __debug__:
             log("dhcp4", f"Sent out DHCP Request message to {dhcp_packet_rx.dhcp_srv_id}")
 
         # Wait for DHCP Ack
-        try:
-            dhcp_packet_rx = dhcp4.ps.Dhcp4Packet(s.recv(timeout=5))
-        except socket.ReceiveTimeout:
-            if __debug__:
-                log("dhcp4", "Didn't receive DHCP ACK message - timeout")
-            s.close()
+        if (dhcp_packet_rx := self._recv_reply(s, dhcp_xid, "ACK")) is None:
             return None, None
 
         if dhcp_packet_rx.dhcp_msg_type != dhcp4.ps.DHCP4_MSG_ACK:
             if __debug__:
                 log("dhcp4", "Didn't receive DHCP ACK message - message type error")
-            s.close()
             return None, None
 
         if __debug__:
@@ -146,7 +176,6 @@ class Dhcp4Client:
                 + f"IP: {dhcp_packet_rx.dhcp_yiaddr}, Mask: {dhcp_packet_rx.dhcp_subnet_mask}, Router: {dhcp_packet_rx.dhcp_router}"
                 + f"DNS: {dhcp_packet_rx.dhcp_dns}, Domain: {dhcp_packet_rx.dhcp_domain_name}",
             )
-        s.close()
 
         assert dhcp_packet_rx.dhcp_subnet_mask is not None
         return (
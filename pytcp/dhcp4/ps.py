@@ -32,9 +32,13 @@
 from __future__ import annotations
 
 import struct
+from typing import TYPE_CHECKING
 
 from lib.ip4_address import Ip4Address, Ip4Mask
 
+if TYPE_CHECKING:
+    from typing import Sequence
+
 # DHCP packet header (RFC 2131)
 
 # +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+
@@ -125,6 +129,10 @@ DHCP4_MSG_NAK = 6
 DHCP4_MSG_RELEASE = 7
 DHCP4_MSG_INFORM = 8
 
+# Empty 'Server Host Name' and 'Boot File Name' fields of outbound packets
+_DHCP4_SNAME_EMPTY = b"\0" * 64
+_DHCP4_FILE_EMPTY = b"\0" * 128
+
 
 class Dhcp4Packet:
     """Dhcp packet support class"""
@@ -150,7 +158,7 @@ class Dhcp4Packet:
         dhcp_req_ip_addr: Ip4Address | None = None,
         dhcp_addr_lease_time: int | None = None,
         dhcp_srv_id: Ip4Address | None = None,
-        dhcp_param_req_list: list[int] | None = None,
+        dhcp_param_req_list: Sequence[int] | None = None,
         dhcp_msg_type: int | None = None,
     ) -> None:
         """Class constructor"""
@@ -243,8 +251,8 @@ class Dhcp4Packet:
             self.dhcp_siaddr = dhcp_siaddr
             self.dhcp_giaddr = dhcp_giaddr
             self.dhcp_chaddr = dhcp_chaddr
-            self.dhcp_sname = b"\0" * 64
-            self.dhcp_file = b"\0" * 128
+            self.dhcp_sname = _DHCP4_SNAME_EMPTY
+            self.dhcp_file = _DHCP4_FILE_EMPTY
 
             self.dhcp_options = []
 
@@ -727,7 +735,7 @@ DHCP4_OPT_PARAM_REQ_LIST_LEN = None
 class Dhcp4OptParamReqList:
     """DHCP option - Parameter Request List (55)"""
 
-    def __init__(self, raw_option: bytes | None = None, opt_param_req_list: list[int] | None = None) -> None:
+    def __init__(self, raw_option: bytes | None = None, opt_param_req_list: Sequence[int] | None = None) -> None:
         if raw_option:
             self.opt_code = raw_option[0]
             self.opt_len = raw_option[1]
@@ -736,7 +744,7 @@ class Dhcp4OptParamReqList:
             assert opt_param_req_list is not None
             self.opt_code = DHCP4_OPT_PARAM_REQ_LIST
             self.opt_len = len(opt_param_req_list)
-            self.opt_param_req_list = opt_param_req_list
+            self.opt_param_req_list = list(opt_param_req_list)
 
     @property
     def raw_option(self) -> bytes:
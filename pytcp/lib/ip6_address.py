@@ -33,7 +33,6 @@ from __future__ import annotations
 
 import re
 import socket
-import struct
 
 from lib.ip_address import (
     IpAddress,
@@ -47,19 +46,39 @@ from lib.ip_address import (
 )
 from lib.mac_address import MacAddress
 
-IP6_REGEX = (
-    r"("
-    + r"([0-9a-fA-F]{1,4}:){7,7}[0-9a-fA-F]{1,4}|"  # 1:2:3:4:5:6:7:8
-    + r"([0-9a-fA-F]{1,4}:){1,7}:|"  # 1::, 1:2:3:4:5:6:7::
-    + r"([0-9a-fA-F]{1,4}:){1,6}:[0-9a-fA-F]{1,4}|"  # 1::8, 1:2:3:4:5:6::8
-    + r"([0-9a-fA-F]{1,4}:){1,5}(:[0-9a-fA-F]{1,4}){1,2}|"  # 1::7:8, 1:2:3:4:5::7:8, 1:2:3:4:5::8
-    + r"([0-9a-fA-F]{1,4}:){1,4}(:[0-9a-fA-F]{1,4}){1,3}|"  # 1::6:7:8, 1:2:3:4::6:7:8, 1:2:3:4::8
-    + r"([0-9a-fA-F]{1,4}:){1,3}(:[0-9a-fA-F]{1,4}){1,4}|"  # 1::5:6:7:8, 1:2:3::5:6:7:8, 1:2:3::8
-    + r"([0-9a-fA-F]{1,4}:){1,2}(:[0-9a-fA-F]{1,4}){1,5}|"  # 1::4:5:6:7:8, 1:2::4:5:6:7:8, 1:2::8
-    + r"[0-9a-fA-F]{1,4}:((:[0-9a-fA-F]{1,4}){1,6})|"  # 1::3:4:5:6:7:8, 1::3:4:5:6:7:8, 1::8
-    + r":((:[0-9a-fA-F]{1,4}){1,7}|:)"  # ::2:3:4:5:6:7:8, ::2:3:4:5:6:7:8, ::8, ::
-    + r")"
-)
+# Pattern is compiled once and anchored so match doesn't scan the whole string
+_IP6_MASK_RE = re.compile(r"^\/\d{1,3}$")
+
+# Upper bound (exclusive) of 128-bit integer values
+_IP6_MAX = 1 << 128
+
+# Boundaries of IPv6 address ranges used for address classification, lower bound inclusive, upper bound exclusive
+_IP6_GLOBAL_LO = 42535295865117307932921825928971026432  # 2000::/3
+_IP6_GLOBAL_HI = 85070591730234615865843651857942052864
+_IP6_PRIVATE_LO = 334965454937798799971759379190646833152  # fc00::/7
+_IP6_PRIVATE_HI = 337623910929368631717566993311207522304
+_IP6_LINK_LOCAL_LO = 338288524927261089654018896841347694592  # fe80::/10
+_IP6_LINK_LOCAL_HI = 338620831926207318622244848606417780736
+_IP6_MULTICAST_LO = 338953138925153547590470800371487866880  # ff00::/8
+_IP6_MULTICAST_HI = _IP6_MAX
+_IP6_SNM_LO = 338963523518870617245727861372719464448  # ff02::1:ff00:0/104
+_IP6_SNM_HI = 338963523518870617245727861372736241664
+
+# Prefixes used to derive solicited node multicast address and multicast MAC address from IPv6 address
+_SOL_NODE_MC_PREFIX = _IP6_SNM_LO  # ff02::1:ff00:0
+_MCAST_MAC_PREFIX = 0x333300000000  # 33:33:00:00:00:00
+
+_IP6_ALL_ONES = _IP6_MAX - 1
+
+# Masks for all possible CIDR prefix lengths, indexed by prefix length
+_IP6_CIDR_MASKS = tuple(_IP6_ALL_ONES ^ (_IP6_ALL_ONES >> bit_count) for bit_count in range(129))
+
+
+def _is_contiguous(mask: int) -> bool:
+    """Validate that mask is made of consecutive bits, inverted contiguous mask is a run of low order ones so adding one clears all its bits"""
+
+    inverted = ~mask & _IP6_ALL_ONES
+    return inverted & (inverted + 1) == 0
 
 
 class Ip6AddressFormatError(IpAddressFormatError):
@@ -81,31 +100,34 @@ class Ip6HostFormatError(IpHostFormatError):
 class Ip6Address(IpAddress):
     """IPv6 address support class"""
 
+    __slots__ = ("_address", "_version", "_snm", "_str", "_bytes")
+
     def __init__(self, address: Ip6Address | str | bytes | bytearray | memoryview | int) -> None:
         """Class constructor"""
 
         self._address: int
         self._version: int = 6
+        self._snm: Ip6Address | None = None
+        self._str: str | None = None
+        self._bytes: bytes | None = None
 
         if isinstance(address, int):
-            if address in range(340282366920938463463374607431768211455):
+            if 0 <= address < _IP6_MAX:
                 self._address = address
                 return
 
-        if isinstance(address, memoryview) or isinstance(address, bytes) or isinstance(address, bytearray):
+        if isinstance(address, (memoryview, bytes, bytearray)):
             if len(address) == 16:
-                v1, v2, v3, v4 = struct.unpack("!LLLL", address)
-                self._address = (v1 << 96) + (v2 << 64) + (v3 << 32) + v4
+                self._address = int.from_bytes(address, "big")
                 return
 
         if isinstance(address, str):
-            if re.search(IP6_REGEX, address):
-                try:
-                    v1, v2, v3, v4 = struct.unpack("!LLLL", socket.inet_pton(socket.AF_INET6, address))
-                    self._address = (v1 << 96) + (v2 << 64) + (v3 << 32) + v4
-                    return
-                except OSError:
-                    pass
+            # The inet_pton() call is the sole validator of address string format
+            try:
+                self._address = int.from_bytes(socket.inet_pton(socket.AF_INET6, address), "big")
+                return
+            except OSError:
+                pass
 
         if isinstance(address, Ip6Address):
             self._address = int(address)
@@ -114,16 +136,18 @@ class Ip6Address(IpAddress):
         raise Ip6AddressFormatError(address)
 
     def __str__(self) -> str:
-        """String representation"""
+        """String representation, computed once and cached"""
 
-        return socket.inet_ntop(socket.AF_INET6, bytes(self))
+        if self._str is None:
+            self._str = socket.inet_ntop(socket.AF_INET6, self.__bytes__())
+        return self._str
 
     def __bytes__(self) -> bytes:
-        """Bytes representation"""
+        """Bytes representation, computed once and cached"""
 
-        return struct.pack(
-            "!LLLL", (self._address >> 96) & 0xFFFFFFFF, (self._address >> 64) & 0xFFFFFFFF, (self._address >> 32) & 0xFFFFFFFF, self._address & 0xFFFFFFFF
-        )
+        if self._bytes is None:
+            self._bytes = self._address.to_bytes(16, "big")
+        return self._bytes
 
     @property
     def is_loopback(self) -> bool:
@@ -135,37 +159,39 @@ class Ip6Address(IpAddress):
     def is_global(self) -> bool:
         """Check if IPv6 address is global"""
 
-        return self._address in range(42535295865117307932921825928971026432, 85070591730234615865843651857942052864)  # 2000::/3
+        return _IP6_GLOBAL_LO <= self._address < _IP6_GLOBAL_HI
 
     @property
     def is_private(self) -> bool:
         """Check if IPv6 address is private"""
 
-        return self._address in range(334965454937798799971759379190646833152, 337623910929368631717566993311207522304)  # fc00::/7
+        return _IP6_PRIVATE_LO <= self._address < _IP6_PRIVATE_HI
 
     @property
     def is_link_local(self) -> bool:
         """Check if IPv6 address is link local"""
 
-        return self._address in range(338288524927261089654018896841347694592, 338620831926207318622244848606417780736)  # fe80::/10
+        return _IP6_LINK_LOCAL_LO <= self._address < _IP6_LINK_LOCAL_HI
 
     @property
     def is_multicast(self) -> bool:
         """Check if IPv6 address is multicast"""
 
-        return self._address in range(338953138925153547590470800371487866880, 340282366920938463463374607431768211456)  # ff00::/8
+        return _IP6_MULTICAST_LO <= self._address < _IP6_MULTICAST_HI
 
     @property
     def is_solicited_node_multicast(self) -> bool:
         """Check if address is IPv6 solicited node multicast address"""
 
-        return self._address in range(338963523518870617245727861372719464448, 338963523518870617245727861372736241664)  # ff02::1:ff00:0/104
+        return _IP6_SNM_LO <= self._address < _IP6_SNM_HI
 
     @property
     def solicited_node_multicast(self) -> Ip6Address:
-        """Create IPv6 solicited node multicast address"""
+        """Create IPv6 solicited node multicast address, computed once and cached"""
 
-        return Ip6Address(self._address & 0xFFFFFF | int(Ip6Address("ff02::1:ff00:0")))
+        if self._snm is None:
+            self._snm = Ip6Address(self._address & 0xFFFFFF | _SOL_NODE_MC_PREFIX)
+        return self._snm
 
     @property
     def multicast_mac(self) -> MacAddress:
@@ -173,7 +199,7 @@ class Ip6Address(IpAddress):
 
         assert self.is_multicast
 
-        return MacAddress(int(MacAddress(0x333300000000)) | self._address & 0xFFFFFFFF)
+        return MacAddress(_MCAST_MAC_PREFIX | self._address & 0xFFFFFFFF)
 
     @property
     def unspecified(self) -> Ip6Address:
@@ -185,37 +211,41 @@ class Ip6Address(IpAddress):
 class Ip6Mask(IpMask):
     """IPv6 network mask support class"""
 
+    __slots__ = ("_mask", "_version")
+
+    def __new__(cls, mask: Ip6Mask | str | bytes | bytearray | memoryview | int) -> Ip6Mask:
+        """Return shared instance for CIDR notation masks, create new instance otherwise"""
+
+        if isinstance(mask, str) and (ip6_mask := _IP6_MASK_CACHE.get(mask, None)) is not None:
+            return ip6_mask
+        return super().__new__(cls)
+
     def __init__(self, mask: Ip6Mask | str | bytes | bytearray | memoryview | int) -> None:
         """Class constructor"""
 
+        # Shared instance returned by __new__ is already initialized
+        if hasattr(self, "_mask"):
+            return
+
         self._mask: int
         self._version: int = 6
 
-        def _validate_bits() -> bool:
-            """Validate that mask is made of consecutive bits"""
-            bit_mask = f"{self._mask:0128b}"
-            try:
-                return not bit_mask[bit_mask.index("0") :].count("1")
-            except ValueError:
-                return True
-
         if isinstance(mask, int):
-            if mask in range(340282366920938463463374607431768211456):
+            if 0 <= mask < _IP6_MAX:
                 self._mask = mask
-                if _validate_bits():
+                if _is_contiguous(self._mask):
                     return
 
         if isinstance(mask, memoryview) or isinstance(mask, bytes) or isinstance(mask, bytearray):
             if len(mask) == 16:
-                v1, v2, v3, v4 = struct.unpack("!LLLL", mask)
-                self._mask = (v1 << 96) + (v2 << 64) + (v3 << 32) + v4
-                if _validate_bits():
+                self._mask = int.from_bytes(mask, "big")
+                if _is_contiguous(self._mask):
                     return
 
-        if isinstance(mask, str) and re.search(r"^\/\d{1,3}$", mask):
+        if isinstance(mask, str) and _IP6_MASK_RE.match(mask):
             bit_count = int(mask[1:])
-            if bit_count in range(129):
-                self._mask = int("1" * bit_count + "0" * (128 - bit_count), 2)
+            if bit_count <= 128:
+                self._mask = _IP6_CIDR_MASKS[bit_count]
                 return
 
         if isinstance(mask, Ip6Mask):
@@ -227,12 +257,24 @@ class Ip6Mask(IpMask):
     def __bytes__(self) -> bytes:
         """Bytes representation"""
 
-        return struct.pack("!LLLL", (self._mask >> 96) & 0xFFFFFFFF, (self._mask >> 64) & 0xFFFFFFFF, (self._mask >> 32) & 0xFFFFFFFF, self._mask & 0xFFFFFFFF)
+        return self._mask.to_bytes(16, "big")
+
+    def __getnewargs__(self) -> tuple[int]:
+        """Argument for __new__ when unpickling or copying"""
+
+        return (self._mask,)
+
+
+# Masks are immutable so single instance for each of the CIDR prefix lengths is shared by all users
+_IP6_MASK_CACHE: dict[str, Ip6Mask] = {}
+_IP6_MASK_CACHE.update({f"/{bit_count}": Ip6Mask(f"/{bit_count}") for bit_count in range(129)})
 
 
 class Ip6Network(IpNetwork):
     """IPv6 network support class"""
 
+    __slots__ = ("_address", "_mask", "_version")
+
     def __init__(self, network: Ip6Network | tuple[Ip6Address, Ip6Mask] | str) -> None:
         """Class constructor"""
 
@@ -250,7 +292,9 @@ class Ip6Network(IpNetwork):
         if isinstance(network, str):
             try:
                 address, mask = network.split("/")
-                self._mask = Ip6Mask("/" + mask)
+                if (ip6_mask := _IP6_MASK_CACHE.get("/" + mask, None)) is None:
+                    ip6_mask = Ip6Mask("/" + mask)
+                self._mask = ip6_mask
                 self._address = Ip6Address(int(Ip6Address(address)) & int(self._mask))
                 return
             except (ValueError, Ip6AddressFormatError, Ip6MaskFormatError):
@@ -293,6 +337,8 @@ class Ip6Network(IpNetwork):
 class Ip6Host(IpHost):
     """IPv6 host support class"""
 
+    __slots__ = ("_address", "_network", "_version", "gateway")
+
     def __init__(self, host: Ip6Host | tuple[Ip6Address, Ip6Network] | tuple[Ip6Address, Ip6Mask] | str) -> None:
         """Class constructor"""
 
@@ -59,6 +59,11 @@ class IpHostFormatError(Exception):
 class IpAddress(ABC):
     """IP address support base class"""
 
+    __slots__ = ()
+
+    _address: int
+    _version: int
+
     def __int__(self) -> int:
         """Integer representation"""
 
@@ -111,10 +116,7 @@ class IpAddress(ABC):
 
     @abstractmethod
     def __init__(self, address: int) -> None:
-
-        if TYPE_CHECKING:
-            self._address: int
-            self._version: int
+        pass
 
     @abstractmethod
     def __str__(self) -> str:
@@ -170,6 +172,11 @@ class IpAddress(ABC):
 class IpMask(ABC):
     """IP network support base class"""
 
+    __slots__ = ()
+
+    _mask: int
+    _version: int
+
     def __str__(self) -> str:
         """String representation"""
 
@@ -220,10 +227,7 @@ class IpMask(ABC):
 
     @abstractmethod
     def __init__(self, address: int) -> None:
-
-        if TYPE_CHECKING:
-            self._mask: int
-            self._version: int
+        pass
 
     @abstractmethod
     def __bytes__(self) -> bytes:
@@ -233,6 +237,12 @@ class IpMask(ABC):
 class IpNetwork(ABC):
     """IP network support base class"""
 
+    __slots__ = ()
+
+    _address: IpAddress
+    _mask: IpMask
+    _version: int
+
     def __str__(self) -> str:
         """String representation"""
 
@@ -286,10 +296,6 @@ class IpNetwork(ABC):
     def __init__(self) -> None:
         """Class constructor"""
 
-        self._address: IpAddress
-        self._mask: IpMask
-        self._version: int
-
     @abstractproperty
     def address(self) -> IpAddress:
         pass
@@ -315,6 +321,14 @@ class IpNetwork(ABC):
 class IpHost(ABC):
     """IP host support base class"""
 
+    __slots__ = ()
+
+    _address: IpAddress
+    _network: IpNetwork
+    _version: int
+
+    gateway: IpAddress | None
+
     def __str__(self) -> str:
         """String representation"""
 
@@ -364,9 +378,3 @@ class IpHost(ABC):
     @abstractmethod
     def __init__(self) -> None:
         """Class constructor"""
-
-        self._address: IpAddress
-        self._network: IpNetwork
-        self._version: int
-
-        self.gateway: IpAddress | None
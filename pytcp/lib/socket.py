@@ -244,6 +244,9 @@ class Socket(ABC):
         def recvfrom(self, bufsize: int | None = None, timeout: float | None = None) -> tuple[bytes, tuple[str, int]]:
             pass
 
+        def recv_or_none(self, bufsize: int | None = None, timeout: float | None = None) -> bytes | None:
+            pass
+
         def process_udp_packet(self, packet: UdpMetadata) -> None:
             pass
 
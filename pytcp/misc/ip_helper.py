@@ -31,7 +31,6 @@
 
 from __future__ import annotations
 
-import struct
 from typing import TYPE_CHECKING
 
 import misc.stack as stack
@@ -45,18 +44,18 @@ if TYPE_CHECKING:
 def inet_cksum(data: memoryview, init: int = 0) -> int:
     """Compute Internet Checksum used by IPv4/ICMPv4/ICMPv6/UDP/TCP protocols"""
 
-    if (dlen := len(data)) == 20:
-        cksum = init + sum(struct.unpack("!5L", data))
+    # One's complement sum of 16-bit words is congruent to the whole buffer read as single integer modulo 0xFFFF, so the sum
+    # is computed with one int.from_bytes() conversion and one modulo operation, both running entirely in C. Non-zero sum
+    # that is a multiple of 0xFFFF folds to 0xFFFF rather than 0, odd length data is padded with zero byte.
+    cksum = int.from_bytes(data, "big")
+    if len(data) & 1:
+        cksum <<= 8
+    cksum += init
 
-    else:
-        cksum = init + sum(struct.unpack_from(f"!{dlen >> 3}Q", data))
-        if remainder := dlen & 7:
-            cksum += int().from_bytes(data[-remainder:], byteorder="big") << ((8 - remainder) << 3)
-        cksum = (cksum >> 64) + (cksum & 0xFFFFFFFFFFFFFFFF)
+    if (folded := cksum % 0xFFFF) == 0 and cksum:
+        folded = 0xFFFF
 
-    cksum = (cksum >> 32) + (cksum & 0xFFFFFFFF)
-    cksum = (cksum >> 16) + (cksum & 0xFFFF)
-    return ~(cksum + (cksum >> 16)) & 0xFFFF
+    return ~folded & 0xFFFF
 
 
 def ip_version(ip_address: str) -> int | None:
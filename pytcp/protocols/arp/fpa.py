@@ -39,6 +39,9 @@ from lib.tracker import Tracker
 from protocols.arp.ps import ARP_HEADER_LEN, ARP_OP_REPLY, ARP_OP_REQUEST
 from protocols.ether.ps import ETHER_TYPE_ARP
 
+# Structure is compiled once so the format string doesn't get parsed on every packet
+_ARP_STRUCT = struct.Struct("!HH BBH 6s 4s 6s 4s")
+
 
 class ArpAssembler:
     """ARP packet assembler support class"""
@@ -71,6 +74,12 @@ class ArpAssembler:
         self._tha: MacAddress = tha
         self._tpa: Ip4Address = tpa
 
+        # Addresses in raw form, prepared here so assemble only needs to copy them into the frame
+        self._sha_b: bytes = bytes(sha)
+        self._spa_b: bytes = bytes(spa)
+        self._tha_b: bytes = bytes(tha)
+        self._tpa_b: bytes = bytes(tpa)
+
     def __len__(self) -> int:
         """Length of the packet"""
 
@@ -95,8 +104,7 @@ class ArpAssembler:
     def assemble(self, frame: memoryview) -> None:
         """Assemble packet into the raw form"""
 
-        struct.pack_into(
-            "!HH BBH 6s 4s 6s 4s",
+        _ARP_STRUCT.pack_into(
             frame,
             0,
             self._hrtype,
@@ -104,8 +112,8 @@ class ArpAssembler:
             self._hrlen,
             self._prlen,
             self._oper,
-            bytes(self._sha),
-            bytes(self._spa),
-            bytes(self._tha),
-            bytes(self._tpa),
+            self._sha_b,
+            self._spa_b,
+            self._tha_b,
+            self._tpa_b,
         )
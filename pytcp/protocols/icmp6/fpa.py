@@ -81,7 +81,7 @@ class Icmp6Assembler:
         un_data: bytes | None = None,
         ec_id: int | None = None,
         ec_seq: int | None = None,
-        ec_data: bytes | None = None,
+        ec_data: bytes | memoryview | None = None,
         ra_hop: int | None = None,
         ra_flag_m: bool | None = None,
         ra_flag_o: bool | None = None,
@@ -270,12 +270,14 @@ class Icmp6Assembler:
             return
 
         if self._type == ICMP6_ECHO_REQUEST and self._code == 0:
-            struct.pack_into(f"! BBH HH {len(self._ec_data)}s", frame, 0, self._type, self._code, 0, self._ec_id, self._ec_seq, self._ec_data)
+            struct.pack_into("! BBH HH", frame, 0, self._type, self._code, 0, self._ec_id, self._ec_seq)
+            frame[8 : 8 + len(self._ec_data)] = self._ec_data
             struct.pack_into("! H", frame, 2, inet_cksum(frame, pshdr_sum))
             return
 
         if self._type == ICMP6_ECHO_REPLY and self._code == 0:
-            struct.pack_into(f"! BBH HH {len(self._ec_data)}s", frame, 0, self._type, self._code, 0, self._ec_id, self._ec_seq, bytes(self._ec_data))
+            struct.pack_into("! BBH HH", frame, 0, self._type, self._code, 0, self._ec_id, self._ec_seq)
+            frame[8 : 8 + len(self._ec_data)] = self._ec_data
             struct.pack_into("! H", frame, 2, inet_cksum(frame, pshdr_sum))
             return
 
@@ -148,8 +148,8 @@ class Icmp6Parser:
         return self._cache__cksum
 
     @property
-    def un_data(self) -> bytes:
-        """Read data carried by Unreachable message"""
+    def un_data(self) -> memoryview:
+        """Read data carried by Unreachable message, returned as zero-copy view into the frame"""
 
         if "_cache__un_data" not in self.__dict__:
             assert self.type == ICMP6_UNREACHABLE
@@ -175,8 +175,8 @@ class Icmp6Parser:
         return self._cache__ec_seq
 
     @property
-    def ec_data(self) -> bytes:
-        """Read data carried by Echo message"""
+    def ec_data(self) -> memoryview:
+        """Read data carried by Echo message, returned as zero-copy view into the frame"""
 
         if "_cache__ec_data" not in self.__dict__:
             assert self.type in {ICMP6_ECHO_REQUEST, ICMP6_ECHO_REPLY}
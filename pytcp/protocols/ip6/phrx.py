@@ -45,12 +45,13 @@ from protocols.ip6.ps import (
 def _phrx_ip6(self, packet_rx: PacketRx) -> None:
     """Handle inbound IPv6 packets"""
 
-    self.packet_stats_rx.ip6__pre_parse += 1
+    stats = self.packet_stats_rx
+    stats.ip6__pre_parse += 1
 
     Ip6Parser(packet_rx)
 
     if packet_rx.parse_failed:
-        self.packet_stats_rx.ip6__failed_parse__drop += 1
+        stats.ip6__failed_parse__drop += 1
         if __debug__:
             log("ip6", f"{packet_rx.tracker} - <rb>{packet_rx.parse_failed}</>")
         return
@@ -59,30 +60,27 @@ def _phrx_ip6(self, packet_rx: PacketRx) -> None:
         log("ip6", f"{packet_rx.tracker} - {packet_rx.ip6}")
 
     # Check if received packet has been sent to us directly or by unicast or multicast
-    if packet_rx.ip6.dst not in {*self.ip6_unicast, *self.ip6_multicast}:
-        self.packet_stats_rx.ip6__dst_unknown__drop += 1
+    ip6_dst = packet_rx.ip6.dst
+    if ip6_dst not in self._ip6_local_addrs:
+        stats.ip6__dst_unknown__drop += 1
         if __debug__:
             log("ip6", f"{packet_rx.tracker} - IP packet not destined for this stack, dropping")
         return
 
-    if packet_rx.ip6.dst in self.ip6_unicast:
-        self.packet_stats_rx.ip6__dst_unicast += 1
+    if ip6_dst in self._ip6_unicast_set:
+        stats.ip6__dst_unicast += 1
 
-    if packet_rx.ip6.dst in self.ip6_multicast:
-        self.packet_stats_rx.ip6__dst_multicast += 1
+    if ip6_dst in self._ip6_multicast_set:
+        stats.ip6__dst_multicast += 1
 
-    if packet_rx.ip6.next == IP6_NEXT_EXT_FRAG:
-        self._phrx_ip6_ext_frag(packet_rx)
-        return
+    if handler := _NEXT_HANDLER.get(packet_rx.ip6.next, None):
+        getattr(self, handler)(packet_rx)
 
-    if packet_rx.ip6.next == IP6_NEXT_ICMP6:
-        self._phrx_icmp6(packet_rx)
-        return
 
-    if packet_rx.ip6.next == IP6_NEXT_UDP:
-        self._phrx_udp(packet_rx)
-        return
-
-    if packet_rx.ip6.next == IP6_NEXT_TCP:
-        self._phrx_tcp(packet_rx)
-        return
+# Names of packet handler methods processing the supported IPv6 next headers
+_NEXT_HANDLER: dict[int, str] = {
+    IP6_NEXT_EXT_FRAG: "_phrx_ip6_ext_frag",
+    IP6_NEXT_ICMP6: "_phrx_icmp6",
+    IP6_NEXT_UDP: "_phrx_udp",
+    IP6_NEXT_TCP: "_phrx_tcp",
+}
@@ -59,14 +59,14 @@ def _validate_src_ip6_address(
     tracker = carried_packet.tracker
 
     # Check if the the source IP address belongs to this stack or its unspecified
-    if ip6_src not in {*self.ip6_unicast, *self.ip6_multicast, Ip6Address(0)}:
+    if ip6_src not in self._ip6_local_addrs and not ip6_src.is_unspecified:
         self.packet_stats_tx.ip6__src_not_owned__drop += 1
         if __debug__:
             log("ip6", f"{tracker} - <WARN>Unable to sent out IPv6 packet, stack doesn't own IPv6 address {ip6_src}, dropping</>")
         return TxStatus.DROPED__IP6__SRC_NOT_OWNED
 
     # If packet is a response to multicast then replace source address with link local address of the stack
-    if ip6_src in self.ip6_multicast:
+    if ip6_src in self._ip6_multicast_set:
         if self.ip6_unicast:
             self.packet_stats_tx.ip6__src_multicast__replace += 1
             ip6_src = self.ip6_unicast[0]
@@ -53,6 +53,22 @@ from protocols.tcp.ps import (
     TCP_OPT_WSCALE_LEN,
 )
 
+# Structures are compiled once so the format strings don't get parsed on every packet
+_TCP_HEADER_STRUCT = struct.Struct("! HH L L BBH HH")
+_TCP_CKSUM_STRUCT = struct.Struct("! H")
+_TCP_OPT_MSS_STRUCT = struct.Struct("! BB H")
+_TCP_OPT_WSCALE_STRUCT = struct.Struct("! BB B")
+_TCP_OPT_TIMESTAMP_STRUCT = struct.Struct("! BB LL")
+
+# Options without variable fields always have the same raw form
+_TCP_OPT_EOL_RAW = struct.pack("!B", TCP_OPT_EOL)
+_TCP_OPT_NOP_RAW = struct.pack("!B", TCP_OPT_NOP)
+_TCP_OPT_SACKPERM_RAW = struct.pack("! BB", TCP_OPT_SACKPERM, TCP_OPT_SACKPERM_LEN)
+
+# Flag letters for log strings, indexed by nine bit value made of NS flag followed by the flags byte
+_TCP_FLAG_LETTERS = "NCEUAPRSF"
+_TCP_FLAGS_STR = tuple("".join(letter for bit, letter in enumerate(_TCP_FLAG_LETTERS) if index & (0x100 >> bit)) for index in range(0x200))
+
 
 class TcpAssembler:
     """TCP packet assembler support class"""
@@ -109,10 +125,15 @@ class TcpAssembler:
         self._urp: int = urp
         self._options: list[TcpOptMss | TcpOptWscale | TcpOptSackPerm | TcpOptTimestamp | TcpOptEol | TcpOptNop] = [] if options is None else options
         self._data: bytes = b"" if data is None else data
-        self._hlen: int = TCP_HEADER_LEN + sum(len(_) for _ in self._options)
+        self._raw_options_bytes: bytes = b"".join(bytes(_) for _ in self._options)
+        self._hlen: int = TCP_HEADER_LEN + len(self._raw_options_bytes)
 
         assert self._hlen % 4 == 0, f"TCP header len {self._hlen} is not multiplcation of 4 bytes, check options... {self._options}"
 
+        # Header bytes carrying data offset and flags don't change after packet is created so they are packed here once
+        self._data_off_byte: int = self._hlen << 2 | flag_ns
+        self._flags: int = flag_crw << 7 | flag_ece << 6 | flag_urg << 5 | flag_ack << 4 | flag_psh << 3 | flag_rst << 2 | flag_syn << 1 | flag_fin
+
     def __len__(self) -> int:
         """Length of the packet"""
 
@@ -122,10 +143,8 @@ class TcpAssembler:
         """Packet log string"""
 
         log = (
-            f"TCP {self._sport} > {self._dport}, {'N' if self._flag_ns else ''}{'C' if self._flag_crw else ''}"
-            + f"{'E' if self._flag_ece else ''}{'U' if self._flag_urg else ''}{'A' if self._flag_ack else ''}"
-            + f"{'P' if self._flag_psh else ''}{'R' if self._flag_rst else ''}{'S' if self._flag_syn else ''}"
-            + f"{'F' if self._flag_fin else ''}, seq {self._seq}, ack {self._ack}, win {self._win}, dlen {len(self._data)}"
+            f"TCP {self._sport} > {self._dport}, {_TCP_FLAGS_STR[self._flag_ns << 8 | self._flags]}"
+            + f", seq {self._seq}, ack {self._ack}, win {self._win}, dlen {len(self._data)}"
         )
 
         for option in self._options:
@@ -143,36 +162,28 @@ class TcpAssembler:
     def _raw_options(self) -> bytes:
         """Packet options in raw format"""
 
-        return b"".join(bytes(option) for option in self._options)
+        return self._raw_options_bytes
 
     def assemble(self, frame: memoryview, pshdr_sum: int) -> None:
         """Assemble packet into the raw form"""
 
-        struct.pack_into(
-            f"! HH L L BBH HH {len(self._raw_options)}s {len(self._data)}s",
+        _TCP_HEADER_STRUCT.pack_into(
             frame,
             0,
             self._sport,
             self._dport,
             self._seq,
             self._ack,
-            self._hlen << 2 | self._flag_ns,
-            self._flag_crw << 7
-            | self._flag_ece << 6
-            | self._flag_urg << 5
-            | self._flag_ack << 4
-            | self._flag_psh << 3
-            | self._flag_rst << 2
-            | self._flag_syn << 1
-            | self._flag_fin,
+            self._data_off_byte,
+            self._flags,
             self._win,
             0,
             self._urp,
-            self._raw_options,
-            self._data,
         )
+        frame[TCP_HEADER_LEN : self._hlen] = self._raw_options_bytes
+        frame[self._hlen : self._hlen + len(self._data)] = self._data
 
-        struct.pack_into("! H", frame, 16, inet_cksum(frame, pshdr_sum))
+        _TCP_CKSUM_STRUCT.pack_into(frame, 16, inet_cksum(frame, pshdr_sum))
 
 
 #
@@ -201,7 +212,7 @@ class TcpOptEol:
     def __bytes__(self) -> bytes:
         """Option in raw form"""
 
-        return struct.pack("!B", TCP_OPT_EOL)
+        return _TCP_OPT_EOL_RAW
 
     def __eq__(self, other) -> bool:
         """Equal operator"""
@@ -230,7 +241,7 @@ class TcpOptNop:
     def __bytes__(self) -> bytes:
         """Option in raw form"""
 
-        return struct.pack("!B", TCP_OPT_NOP)
+        return _TCP_OPT_NOP_RAW
 
     def __eq__(self, other) -> bool:
         """Equal operator"""
@@ -263,7 +274,7 @@ class TcpOptMss:
     def __bytes__(self) -> bytes:
         """Option in raw form"""
 
-        return struct.pack("! BB H", TCP_OPT_MSS, TCP_OPT_MSS_LEN, self._mss)
+        return _TCP_OPT_MSS_STRUCT.pack(TCP_OPT_MSS, TCP_OPT_MSS_LEN, self._mss)
 
     def __eq__(self, other) -> bool:
         """Equal operator"""
@@ -296,7 +307,7 @@ class TcpOptWscale:
     def __bytes__(self) -> bytes:
         """Option in raw form"""
 
-        return struct.pack("! BB B", TCP_OPT_WSCALE, TCP_OPT_WSCALE_LEN, self._wscale)
+        return _TCP_OPT_WSCALE_STRUCT.pack(TCP_OPT_WSCALE, TCP_OPT_WSCALE_LEN, self._wscale)
 
     def __eq__(self, other) -> bool:
         """Equal operator"""
@@ -325,7 +336,7 @@ class TcpOptSackPerm:
     def __bytes__(self) -> bytes:
         """Option in raw form"""
 
-        return struct.pack("! BB", TCP_OPT_SACKPERM, TCP_OPT_SACKPERM_LEN)
+        return _TCP_OPT_SACKPERM_RAW
 
     def __eq__(self, other) -> bool:
         """Equal operator"""
@@ -360,7 +371,7 @@ class TcpOptTimestamp:
     def __bytes__(self) -> bytes:
         """Option in raw form"""
 
-        return struct.pack("! BB LL", TCP_OPT_TIMESTAMP, TCP_OPT_TIMESTAMP_LEN, self._tsval, self._tsecr)
+        return _TCP_OPT_TIMESTAMP_STRUCT.pack(TCP_OPT_TIMESTAMP, TCP_OPT_TIMESTAMP_LEN, self._tsval, self._tsecr)
 
     def __eq__(self, other) -> bool:
         """Equal operator"""
@@ -36,6 +36,8 @@ from typing import TYPE_CHECKING
 from lib.ip4_address import Ip4Address
 
 if TYPE_CHECKING:
+    from typing import Iterator
+
     from lib.ip_address import IpAddress
     from lib.tracker import Tracker
 
@@ -65,16 +67,15 @@ class UdpMetadata:
         return f"AF_INET{self.local_ip_address.version}/SOCK_DGRAM/{self.local_ip_address}/{self.local_port}/{self.remote_ip_address}/{self.remote_port}"
 
     @property
-    def socket_patterns(self) -> list[str]:
-        """Socket ID patterns that match this packet"""
+    def socket_patterns(self) -> Iterator[str]:
+        """Socket ID patterns that match this packet, generated lazily from most to least specific so lookup that hits early skips formatting the rest"""
 
-        patterns = [
-            f"AF_INET{self.local_ip_address.version}/SOCK_DGRAM/{self.local_ip_address}/{self.local_port}/{self.remote_ip_address}/{self.remote_port}",
-            f"AF_INET{self.local_ip_address.version}/SOCK_DGRAM/{self.local_ip_address}/{self.local_port}/{self.local_ip_address.unspecified}/0",
-            f"AF_INET{self.local_ip_address.version}/SOCK_DGRAM/{self.local_ip_address.unspecified}/{self.local_port}/{self.local_ip_address.unspecified}/0",
-        ]
+        prefix = f"AF_INET{self.local_ip_address.version}/SOCK_DGRAM/"
+        unspecified = self.local_ip_address.unspecified
 
-        if isinstance(self.local_ip_address, Ip4Address):
-            patterns.append(f"AF_INET4/SOCK_DGRAM/0.0.0.0/{self.local_port}/255.255.255.255/{self.remote_port}")  # For DHCPv4 client
+        yield f"{prefix}{self.local_ip_address}/{self.local_port}/{self.remote_ip_address}/{self.remote_port}"
+        yield f"{prefix}{self.local_ip_address}/{self.local_port}/{unspecified}/0"
+        yield f"{prefix}{unspecified}/{self.local_port}/{unspecified}/0"
 
-        return patterns
+        if isinstance(self.local_ip_address, Ip4Address):
+            yield f"AF_INET4/SOCK_DGRAM/0.0.0.0/{self.local_port}/255.255.255.255/{self.remote_port}"  # For DHCPv4 client
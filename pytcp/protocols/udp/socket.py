@@ -214,6 +214,13 @@ class UdpSocket(Socket):
     def recv(self, bufsize: int | None = None, timeout: float | None = None) -> bytes:
         """Read data from socket"""
 
+        if (data_rx := self.recv_or_none(bufsize, timeout)) is None:
+            raise ReceiveTimeout
+        return data_rx
+
+    def recv_or_none(self, bufsize: int | None = None, timeout: float | None = None) -> bytes | None:
+        """Read data from socket, return None on timeout instead of raising exception"""
+
         # TODO - Implement support for buffsize
 
         if self._unreachable:
@@ -225,7 +232,7 @@ class UdpSocket(Socket):
             if __debug__:
                 log("socket", f"<g>[{self}]</> - <lg>Received</> {len(data_rx)} bytes of data")
             return data_rx
-        raise ReceiveTimeout
+        return None
 
     def recvfrom(self, bufsize: int | None = None, timeout: float | None = None) -> tuple[bytes, tuple[str, int]]:
         """Read data from socket"""
@@ -52,7 +52,7 @@ class ArpCache:
 
             self.mac_address: MacAddress = mac_address
             self.permanent: bool = permanent
-            self.creation_time: float = time.time()
+            self.creation_time: float = time.monotonic()
             self.hit_count: int = 0
 
     def __init__(self) -> None:
@@ -69,26 +69,39 @@ class ArpCache:
     def _maintain_cache(self) -> None:
         """Method responsible for maintaining ARP cache entries"""
 
-        for ip4_address in list(self.arp_cache):
+        now = time.monotonic()
+        max_age = config.ARP_CACHE_ENTRY_MAX_AGE
+        refresh_age = config.ARP_CACHE_ENTRY_MAX_AGE - config.ARP_CACHE_ENTRY_REFRESH_TIME
+
+        expired: list[tuple[Ip4Address, ArpCache.CacheEntry]] = []
+        to_refresh: list[tuple[Ip4Address, ArpCache.CacheEntry]] = []
+
+        for ip4_address, arp_entry in tuple(self.arp_cache.items()):
 
             # Skip permanent entries
-            if self.arp_cache[ip4_address].permanent:
+            if arp_entry.permanent:
                 continue
 
             # If entry age is over maximum age then discard the entry
-            if time.time() - self.arp_cache[ip4_address].creation_time > config.ARP_CACHE_ENTRY_MAX_AGE:
-                mac_address = self.arp_cache.pop(ip4_address).mac_address
-                if __debug__:
-                    log("arp-c", f"Discarded expir ARP cache entry - {ip4_address} -> {mac_address}")
+            if (age := now - arp_entry.creation_time) > max_age:
+                expired.append((ip4_address, arp_entry))
 
             # If entry age is close to maximum age but the entry has been used since last refresh then send out request in attempt to refresh it
-            elif (
-                time.time() - self.arp_cache[ip4_address].creation_time > config.ARP_CACHE_ENTRY_MAX_AGE - config.ARP_CACHE_ENTRY_REFRESH_TIME
-            ) and self.arp_cache[ip4_address].hit_count:
-                self.arp_cache[ip4_address].hit_count = 0
-                self._send_arp_request(ip4_address)
+            elif age > refresh_age and arp_entry.hit_count:
+                arp_entry.hit_count = 0
+                to_refresh.append((ip4_address, arp_entry))
+
+        # Entries refreshed in the meantime are replaced with new objects, so identity check keeps them from being discarded
+        for ip4_address, arp_entry in expired:
+            if self.arp_cache.get(ip4_address, None) is arp_entry:
+                del self.arp_cache[ip4_address]
                 if __debug__:
-                    log("arp-c", f"Trying to refresh expiring ARP cache entry for {ip4_address} -> {self.arp_cache[ip4_address].mac_address}")
+                    log("arp-c", f"Discarded expir ARP cache entry - {ip4_address} -> {arp_entry.mac_address}")
+
+        for ip4_address, arp_entry in to_refresh:
+            self._send_arp_request(ip4_address)
+            if __debug__:
+                log("arp-c", f"Trying to refresh expiring ARP cache entry for {ip4_address} -> {arp_entry.mac_address}")
 
     def add_entry(self, ip4_address: Ip4Address, mac_address: MacAddress) -> None:
         """Add / refresh entry in cache"""
@@ -106,7 +119,7 @@ class ArpCache:
                 log(
                     "arp-c",
                     f"Found {ip4_address} -> {arp_entry.mac_address} entry, age "
-                    + f"{time.time() - arp_entry.creation_time:.0f}s, hit_count {arp_entry.hit_count}",
+                    + f"{time.monotonic() - arp_entry.creation_time:.0f}s, hit_count {arp_entry.hit_count}",
                 )
             return arp_entry.mac_address
 
@@ -31,6 +31,10 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
+import math
+import threading
 import time
 
 import config
@@ -40,75 +44,135 @@ from lib.logger import log
 from lib.mac_address import MacAddress
 from protocols.icmp6.fpa import ICMP6_ND_NEIGHBOR_SOLICITATION, Icmp6NdOptSLLA
 
+# Upper bound (in timer ticks / ms) of maintainer sleep time, timer counts ticks instead of reading the clock
+# so the bound keeps tick drift well within the entry refresh window while idle cache still wakes up rarely
+_MAINTAIN_MAX_DELAY = 60_000
+
 
 class NdCache:
     """Support for ICMPv6 ND cache operations"""
 
-    class CacheEntry:
-        """Container class for cache entries"""
-
-        def __init__(self, mac_address: MacAddress, permanent: bool = False) -> None:
-            self.mac_address: MacAddress = mac_address
-            self.permanent: bool = permanent
-            self.creation_time: float = time.time()
-            self.hit_count: int = 0
-
     def __init__(self) -> None:
         """Class constructor"""
 
-        self.nd_cache: dict[Ip6Address, NdCache.CacheEntry] = {}
+        # Cache entries are stored as parallel containers keyed by IPv6 address rather than as per entry objects
+        self._mac_address: dict[Ip6Address, MacAddress] = {}
+        self._creation_time: dict[Ip6Address, float] = {}
+        self._hit_count: dict[Ip6Address, int] = {}
+
+        # Min-heap of (due_time, sequence, ip6_address) items telling maintainer when given entry needs attention, there is exactly
+        # one item per entry, refreshing entry only updates its creation time and maintainer moves the item when it gets popped early
+        self._maintain_heap: list[tuple[float, int, Ip6Address]] = []
+        self._maintain_sequence = itertools.count()
+        self._lock_cache: threading.Lock = threading.Lock()  # Used to ensure that entries and heap are updated together
+
+        # Send times of recent Neighbor Solicitations, used to coalesce duplicate solicitations for the same target
+        self._pending_ns: dict[Ip6Address, float] = {}
 
-        # Setup timer to execute ND Cache maintainer every second
-        stack.timer.register_method(method=self._maintain_cache, delay=1000)
+        # Maintainer runs as chain of one-shot timer tasks, each run registers the next one from within the timer thread
+        stack.timer.register_method(method=self._maintain_cache, delay=_MAINTAIN_MAX_DELAY, repeat_count=0)
 
-        if __debug__:
+        if __debug__ and "nd-c" in config.LOG_CHANEL:
             log("nd-c", "Started ICMPv6 Neighbor Discovery cache")
 
+    def _schedule_maintain_cache(self, now: float) -> None:
+        """Register one-shot timer for next maintainer run, must be called from timer thread with cache lock held"""
+
+        delay = _MAINTAIN_MAX_DELAY
+        if self._maintain_heap:
+            delay = min(delay, math.ceil((self._maintain_heap[0][0] - now) * 1000))
+
+        # Task registered from within timer thread gets ticked once in the same timer pass, minimum of two ticks
+        # prevents it from firing right away
+        stack.timer.register_method(method=self._maintain_cache, delay=max(2, delay), repeat_count=0)
+
     def _maintain_cache(self) -> None:
         """Method responsible for maintaining ND cache entries"""
 
-        for ip6_address in list(self.nd_cache):
+        now = time.monotonic()
+        max_age = config.ND_CACHE_ENTRY_MAX_AGE
+        refresh_time = config.ND_CACHE_ENTRY_REFRESH_TIME
+        maintain_heap = self._maintain_heap
+
+        with self._lock_cache:
+            while maintain_heap and maintain_heap[0][0] <= now:
+                _, sequence, ip6_address = heapq.heappop(maintain_heap)
+                creation_time = self._creation_time[ip6_address]
+
+                # If entry age is over maximum age then discard the entry
+                if now - creation_time > max_age:
+                    mac_address = self._mac_address.pop(ip6_address)
+                    del self._creation_time[ip6_address]
+                    self._hit_count.pop(ip6_address, None)
+                    if __debug__ and "nd-c" in config.LOG_CHANEL:
+                        log("nd-c", f"Discarded expir ICMPv6 ND cache entry - {ip6_address} -> {mac_address}")
+                    continue
 
-            # Skip permanent entries
-            if self.nd_cache[ip6_address].permanent:
-                continue
+                # Entry has been refreshed since the item was pushed, move the item to the new start of entry's refresh window
+                if (refresh_due := creation_time + max_age - refresh_time) > now:
+                    heapq.heappush(maintain_heap, (refresh_due, sequence, ip6_address))
+                    continue
 
-            # If entry age is over maximum age then discard the entry
-            if time.time() - self.nd_cache[ip6_address].creation_time > config.ND_CACHE_ENTRY_MAX_AGE:
-                mac_address = self.nd_cache.pop(ip6_address).mac_address
-                if __debug__:
-                    log("nd-c", f"Discarded expir ICMPv6 ND cache entry - {ip6_address} -> {mac_address}")
+                # Entry age is close to maximum age, if the entry has been used since last refresh then send out request in attempt to refresh it
+                if self._hit_count.get(ip6_address, 0):
+                    self._hit_count[ip6_address] = 0
+                    self._send_icmp6_neighbor_solicitation(ip6_address)
+                    if __debug__ and "nd-c" in config.LOG_CHANEL:
+                        log("nd-c", f"Trying to refresh expiring ICMPv6 ND cache entry for {ip6_address} -> {self._mac_address[ip6_address]}")
 
-            # If entry age is close to maximum age but the entry has been used since last refresh then send out request in attempt to refresh it
-            elif (
-                time.time() - self.nd_cache[ip6_address].creation_time > config.ND_CACHE_ENTRY_MAX_AGE - config.ND_CACHE_ENTRY_REFRESH_TIME
-            ) and self.nd_cache[ip6_address].hit_count:
-                self.nd_cache[ip6_address].hit_count = 0
-                self._send_icmp6_neighbor_solicitation(ip6_address)
-                if __debug__:
-                    log("nd-c", f"Trying to refresh expiring ICMPv6 ND cache entry for {ip6_address} -> {self.nd_cache[ip6_address].mac_address}")
+                # Keep checking the entry every second until it either gets refreshed or expires
+                heapq.heappush(maintain_heap, (now + 1, sequence, ip6_address))
+
+            self._schedule_maintain_cache(now)
+
+        self._purge_pending_ns(now)
+
+    def _purge_pending_ns(self, now: float) -> None:
+        """Drop pending solicitation records that are past their hold time, runs with every maintainer pass"""
+
+        hold_time = config.ND_CACHE_NS_HOLD_TIME
+        for ip6_address, sent_time in tuple(self._pending_ns.items()):
+            if now - sent_time >= hold_time:
+                self._pending_ns.pop(ip6_address, None)
 
     def add_entry(self, ip6_address: Ip6Address, mac_address: MacAddress) -> None:
         """Add / refresh entry in cache"""
 
-        if __debug__:
+        if __debug__ and "nd-c" in config.LOG_CHANEL:
             log("nd-c", f"<INFO>Adding/refreshing ARP cache entry from direct reply - {ip6_address} -> {mac_address}</>")
-        self.nd_cache[ip6_address] = self.CacheEntry(mac_address)
+
+        now = time.monotonic()
+
+        with self._lock_cache:
+            # New entry gets its heap item, refreshed entry keeps the one it already has
+            if ip6_address not in self._creation_time:
+                heapq.heappush(
+                    self._maintain_heap,
+                    (now + config.ND_CACHE_ENTRY_MAX_AGE - config.ND_CACHE_ENTRY_REFRESH_TIME, next(self._maintain_sequence), ip6_address),
+                )
+            self._creation_time[ip6_address] = now
+            self._hit_count[ip6_address] = 0
+            self._mac_address[ip6_address] = mac_address
+            self._pending_ns.pop(ip6_address, None)
 
     def find_entry(self, ip6_address: Ip6Address) -> MacAddress | None:
         """Find entry in cache and return MAC address"""
 
-        if nd_entry := self.nd_cache.get(ip6_address, None):
-            nd_entry.hit_count += 1
-            if __debug__:
+        # Lookup and hit count update are done under the lock so entry can't get expired by maintainer in between
+        with self._lock_cache:
+            if (mac_address := self._mac_address.get(ip6_address, None)) is not None:
+                self._hit_count[ip6_address] = hit_count = self._hit_count[ip6_address] + 1
+
+        if mac_address is not None:
+            if __debug__ and "nd-c" in config.LOG_CHANEL:
                 log(
                     "nd-c",
-                    f"Found {ip6_address} -> {nd_entry.mac_address} entry, age "
-                    + f"{time.time() - nd_entry.creation_time:.0f}s, hit_count {nd_entry.hit_count}",
+                    f"Found {ip6_address} -> {mac_address} entry, age "
+                    + f"{time.monotonic() - self._creation_time.get(ip6_address, 0):.0f}s, hit_count {hit_count}",
                 )
-            return nd_entry.mac_address
+            return mac_address
 
-        if __debug__:
+        if __debug__ and "nd-c" in config.LOG_CHANEL:
             log("nd-c", f"Unable to find entry for {ip6_address}, sending ICMPv6 Neighbor Solicitation message")
         self._send_icmp6_neighbor_solicitation(ip6_address)
         return None
@@ -116,11 +180,21 @@ class NdCache:
     def _send_icmp6_neighbor_solicitation(self, icmp6_ns_target_address: Ip6Address) -> None:
         """Enqueue ICMPv6 Neighbor Solicitation packet with TX ring"""
 
+        # Don't send out another solicitation if one for the same target is still pending
+        now = time.monotonic()
+        if now - self._pending_ns.get(icmp6_ns_target_address, -math.inf) < config.ND_CACHE_NS_HOLD_TIME:
+            if __debug__ and "nd-c" in config.LOG_CHANEL:
+                log("nd-c", f"Neighbor Solicitation for {icmp6_ns_target_address} already pending, not sending another one")
+            return
+        self._pending_ns[icmp6_ns_target_address] = now
+
         # Pick appropriate source address
         ip6_src = Ip6Address(0)
-        for ip6_host in stack.packet_handler.ip6_host:
-            if icmp6_ns_target_address in ip6_host.network:
-                ip6_src = ip6_host.address
+        target = int(icmp6_ns_target_address)
+        for network, mask, address in stack.packet_handler.ip6_host_table:
+            if target & mask == network:
+                ip6_src = address
+                break
 
         # Send out ND Solicitation message
         stack.packet_handler._phtx_icmp6(
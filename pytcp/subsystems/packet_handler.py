@@ -150,8 +150,13 @@ class PacketHandler:
         self.mac_unicast: MacAddress = MacAddress(config.MAC_ADDRESS)
         self.mac_multicast: list[MacAddress] = []
         self.mac_broadcast: MacAddress = MacAddress(0xFFFFFFFFFFFF)
-        self.ip6_host: list[Ip6Host] = []
-        self.ip6_multicast: list[Ip6Address] = []
+        self._ip6_host_table: list[tuple[int, int, Ip6Address]] = []
+        self._ip6_unicast_set: frozenset[Ip6Address] = frozenset()
+        self._ip6_multicast_set: frozenset[Ip6Address] = frozenset()
+        self._ip6_local_addrs: frozenset[Ip6Address] = frozenset()
+        self._ip6_multicast: list[Ip6Address] = []
+        self.ip6_host = []
+        self.ip6_multicast = []
         self.ip4_host: list[Ip4Host] = []
         self.ip4_multicast: list[Ip4Address] = []
 
@@ -202,6 +207,7 @@ class PacketHandler:
             if config.IP4_HOST_DHCP:
                 dhcp4_client = Dhcp4Client(self.mac_unicast)
                 ip4_host_dhcp = dhcp4_client.fetch()
+                dhcp4_client.close()
             else:
                 ip4_host_dhcp = (None, None)
             self.ip4_host_candidate = self._parse_stack_ip4_host_candidate(
@@ -230,12 +236,63 @@ class PacketHandler:
         while True:
             self._phrx_ether(self.rx_ring.dequeue())
 
+    @property
+    def ip6_host(self) -> list[Ip6Host]:
+        """Getter for _ip6_host"""
+
+        return self._ip6_host
+
+    @ip6_host.setter
+    def ip6_host(self, ip6_host: list[Ip6Host]) -> None:
+        """Setter for _ip6_host, rebuilds everything derived from host list"""
+
+        self._ip6_host = ip6_host
+        self._ip6_host_updated()
+
+    def _ip6_host_updated(self) -> None:
+        """Rebuild structures derived from the IPv6 host list"""
+
+        self._ip6_unicast_set = frozenset(_.address for _ in self._ip6_host)
+
+        # Table of (network, mask, address) integers / address used for source address selection, ordered longest prefix first,
+        # hosts with equal prefix length are ordered in reverse of the host list so the most recently assigned one matches first
+        self._ip6_host_table = [
+            (int(_.network.address), int(_.network.mask), _.address) for _ in sorted(reversed(self._ip6_host), key=lambda _: -len(_.network.mask))
+        ]
+
+        self._rebuild_ip6_local()
+
+    @property
+    def ip6_multicast(self) -> list[Ip6Address]:
+        """Getter for _ip6_multicast"""
+
+        return self._ip6_multicast
+
+    @ip6_multicast.setter
+    def ip6_multicast(self, ip6_multicast: list[Ip6Address]) -> None:
+        """Setter for _ip6_multicast, rebuilds the local address sets"""
+
+        self._ip6_multicast = ip6_multicast
+        self._rebuild_ip6_local()
+
+    def _rebuild_ip6_local(self) -> None:
+        """Rebuild sets of stack's IPv6 addresses used for inbound packet destination checks, needs to run after every host or multicast list change"""
+
+        self._ip6_multicast_set = frozenset(self._ip6_multicast)
+        self._ip6_local_addrs = self._ip6_unicast_set | self._ip6_multicast_set
+
     @property
     def ip6_unicast(self) -> list[Ip6Address]:
         """Return list of stack's IPv6 unicast addresses"""
 
         return [_.address for _ in self.ip6_host]
 
+    @property
+    def ip6_host_table(self) -> list[tuple[int, int, Ip6Address]]:
+        """Return table of (network, mask, address) entries used for IPv6 source address selection, longest prefix first"""
+
+        return self._ip6_host_table
+
     @property
     def ip4_unicast(self) -> list[Ip4Address]:
         """Return list of stack's IPv4 unicast addresses"""
@@ -535,6 +592,7 @@ class PacketHandler:
         """Assign IPv6 host unicast  address to the list stack listens on"""
 
         self.ip6_host.append(ip6_host)
+        self._ip6_host_updated()
         if __debug__:
             log("stack", f"Assigned IPv6 unicast address {ip6_host}")
         self._assign_ip6_multicast(ip6_host.address.solicited_node_multicast)
@@ -543,6 +601,7 @@ class PacketHandler:
         """Remove IPv6 ihost unicast address from the list stack listens on"""
 
         self.ip6_host.remove(ip6_host)
+        self._ip6_host_updated()
         if __debug__:
             log("stack", f"Removed IPv6 unicast address {ip6_host}")
         self._remove_ip6_multicast(ip6_host.address.solicited_node_multicast)
@@ -551,6 +610,7 @@ class PacketHandler:
         """Assign IPv6 multicast address to the list stack listens on"""
 
         self.ip6_multicast.append(ip6_multicast)
+        self._rebuild_ip6_local()
         if __debug__:
             log("stack", f"Assigned IPv6 multicast {ip6_multicast}")
         self._assign_mac_multicast(ip6_multicast.multicast_mac)
@@ -561,6 +621,7 @@ class PacketHandler:
         """Remove IPv6 multicast address from the list stack listens on"""
 
         self.ip6_multicast.remove(ip6_multicast)
+        self._rebuild_ip6_local()
         if __debug__:
             log("stack", f"Removed IPv6 multicast {ip6_multicast}")
         self._remove_mac_multicast(ip6_multicast.multicast_mac)
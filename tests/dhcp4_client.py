@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+
+############################################################################
+#                                                                          #
+#  PyTCP - Python TCP/IP stack                                             #
+#  Copyright (C) 2020-2021  Sebastian Majewski                             #
+#                                                                          #
+#  This program is free software: you can redistribute it and/or modify    #
+#  it under the terms of the GNU General Public License as published by    #
+#  the Free Software Foundation, either version 3 of the License, or       #
+#  (at your option) any later version.                                     #
+#                                                                          #
+#  This program is distributed in the hope that it will be useful,         #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of          #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the           #
+#  GNU General Public License for more details.                            #
+#                                                                          #
+#  You should have received a copy of the GNU General Public License       #
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.  #
+#                                                                          #
+#  Author's email: ccie18643@gmail.com                                     #
+#  Github repository: https://github.com/ccie18643/PyTCP                   #
+#                                                                          #
+############################################################################
+
+
+#
+# tests/dhcp4_client.py - unit tests for Dhcp4Client class
+#
+
+
+from dhcp4.client import Dhcp4Client
+from dhcp4.ps import (
+    DHCP4_MSG_ACK,
+    DHCP4_MSG_DISCOVER,
+    DHCP4_MSG_OFFER,
+    DHCP4_MSG_REQUEST,
+    DHCP4_OP_REPLY,
+    Dhcp4Packet,
+)
+from lib.ip4_address import Ip4Address, Ip4Mask
+from lib.mac_address import MacAddress
+from protocols.udp.socket import UdpSocket
+from testslide import StrictMock, TestCase
+
+
+class TestDhcp4Client(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.mock_callable("dhcp4.client", "log").to_return_value(None)
+        self.mock_callable("dhcp4.client.random", "randint").to_return_value(0x12345678)
+
+        # Socket mock keeps queue of inbound datagrams, exception queued instead of datagram mimics ICMP Unreachable notification,
+        # server replies are queued when client's Discover / Request messages are sent
+        self.rx_queue = []
+        self.replies = {}
+        self.socket_mock = StrictMock(template=UdpSocket)
+        self.mock_callable(self.socket_mock, "bind").to_return_value(None)
+        self.mock_callable(self.socket_mock, "connect").to_return_value(None)
+        self.mock_callable(self.socket_mock, "close").to_return_value(None)
+        self.mock_callable(self.socket_mock, "send").with_implementation(self._send)
+        self.mock_callable(self.socket_mock, "recv_or_none").with_implementation(self._recv_or_none)
+        self.mock_callable("dhcp4.client.socket", "socket").to_return_value(self.socket_mock)
+
+        self.dhcp4_client = Dhcp4Client(MacAddress("02:00:00:00:00:07"))
+
+    def _send(self, data):
+        self.rx_queue.extend(self.replies.get(Dhcp4Packet(data).dhcp_msg_type, []))
+        return len(data)
+
+    def _recv_or_none(self, bufsize=None, timeout=None):
+        if not self.rx_queue:
+            return None
+        if isinstance(data_rx := self.rx_queue.pop(0), Exception):
+            raise data_rx
+        return data_rx
+
+    @staticmethod
+    def _reply(dhcp_xid, dhcp_msg_type, dhcp_yiaddr="10.0.1.7"):
+        return Dhcp4Packet(
+            dhcp_op=DHCP4_OP_REPLY,
+            dhcp_xid=dhcp_xid,
+            dhcp_ciaddr=Ip4Address("0.0.0.0"),
+            dhcp_yiaddr=Ip4Address(dhcp_yiaddr),
+            dhcp_siaddr=Ip4Address("0.0.0.0"),
+            dhcp_giaddr=Ip4Address("0.0.0.0"),
+            dhcp_chaddr=bytes(MacAddress("02:00:00:00:00:07")),
+            dhcp_subnet_mask=Ip4Mask("/24"),
+            dhcp_router=[Ip4Address("10.0.1.1")],
+            dhcp_srv_id=Ip4Address("10.0.1.1"),
+            dhcp_msg_type=dhcp_msg_type,
+        ).raw_packet
+
+    def test_fetch(self):
+        self.replies[DHCP4_MSG_DISCOVER] = [self._reply(0x12345678, DHCP4_MSG_OFFER)]
+        self.replies[DHCP4_MSG_REQUEST] = [self._reply(0x12345678, DHCP4_MSG_ACK)]
+        self.assertEqual(self.dhcp4_client.fetch(), ("10.0.1.7/24", "10.0.1.1"))
+
+    def test_fetch__skip_xid_mismatch(self):
+        self.replies[DHCP4_MSG_DISCOVER] = [self._reply(0x87654321, DHCP4_MSG_OFFER, "10.0.1.66"), self._reply(0x12345678, DHCP4_MSG_OFFER)]
+        self.replies[DHCP4_MSG_REQUEST] = [self._reply(0x87654321, DHCP4_MSG_ACK, "10.0.1.66"), self._reply(0x12345678, DHCP4_MSG_ACK)]
+        self.assertEqual(self.dhcp4_client.fetch(), ("10.0.1.7/24", "10.0.1.1"))
+
+    def test_fetch__timeout(self):
+        self.replies[DHCP4_MSG_DISCOVER] = [self._reply(0x87654321, DHCP4_MSG_OFFER)]
+        self.assertEqual(self.dhcp4_client.fetch(), (None, None))
+
+    def test_fetch__flush_reused_socket(self):
+        self.assertEqual(self.dhcp4_client.fetch(), (None, None))
+
+        # Datagrams and unreachable notification left over from previous transaction are discarded before Discover is sent
+        self.rx_queue.extend(
+            [self._reply(0x12345678, DHCP4_MSG_ACK, "10.0.1.66"), ConnectionRefusedError(), self._reply(0x12345678, DHCP4_MSG_OFFER, "10.0.1.66")]
+        )
+        self.replies[DHCP4_MSG_DISCOVER] = [self._reply(0x12345678, DHCP4_MSG_OFFER)]
+        self.replies[DHCP4_MSG_REQUEST] = [self._reply(0x12345678, DHCP4_MSG_ACK)]
+        self.assertEqual(self.dhcp4_client.fetch(), ("10.0.1.7/24", "10.0.1.1"))
+
+    def test_fetch__bind_failure(self):
+        self.mock_callable(self.socket_mock, "bind").to_raise(OSError("[Errno 98] Address already in use")).and_assert_called_once()
+        self.mock_callable(self.socket_mock, "close").to_return_value(None).and_assert_called_once()
+        with self.assertRaises(OSError):
+            self.dhcp4_client.fetch()
+
+        # Next call sets up new socket instead of using the unbound one
+        self.mock_callable(self.socket_mock, "bind").to_return_value(None).and_assert_called_once()
+        self.replies[DHCP4_MSG_DISCOVER] = [self._reply(0x12345678, DHCP4_MSG_OFFER)]
+        self.replies[DHCP4_MSG_REQUEST] = [self._reply(0x12345678, DHCP4_MSG_ACK)]
+        self.assertEqual(self.dhcp4_client.fetch(), ("10.0.1.7/24", "10.0.1.1"))
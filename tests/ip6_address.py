@@ -29,6 +29,7 @@
 #
 
 
+import copy
 from dataclasses import dataclass
 
 from lib.mac_address import MacAddress
@@ -93,6 +94,7 @@ class TestIp6Address(TestCase):
         self.assertEqual(Ip6Address(bytearray(b" \x01\x00\x00\x00\x00\x00\x00\x124Vx\x90\xab\xcd\xef"))._address, 42540488161975842761862124892595146223)
         self.assertEqual(Ip6Address(memoryview(b" \x01\x00\x00\x00\x00\x00\x00\x124Vx\x90\xab\xcd\xef"))._address, 42540488161975842761862124892595146223)
         self.assertEqual(Ip6Address(42540488161975842761862124892595146223)._address, 42540488161975842761862124892595146223)
+        self.assertEqual(Ip6Address(340282366920938463463374607431768211455)._address, 340282366920938463463374607431768211455)
         self.assertRaises(Ip6AddressFormatError, Ip6Address, "2001::1234:5678:90ab:cdeg")
         self.assertRaises(Ip6AddressFormatError, Ip6Address, "2001:1234:5678:90ab:cdef")
         self.assertRaises(Ip6AddressFormatError, Ip6Address, "2001::1234::5678:90ab:cdef")
@@ -181,6 +183,9 @@ class TestIp6Mask(TestCase):
         self.assertRaises(Ip6MaskFormatError, Ip6Mask, -1)
         self.assertRaises(Ip6MaskFormatError, Ip6Mask, 340282366920938463463374607431768211456)
         self.assertRaises(Ip6MaskFormatError, Ip6Mask, 64)
+        self.assertIs(Ip6Mask("/64"), Ip6Mask("/64"))
+        self.assertEqual(Ip6Mask("/064")._mask, 340282366920938463444927863358058659840)
+        self.assertIsNot(Ip6Mask("/064"), Ip6Mask("/64"))
 
     def test___str__(self):
         self.assertEqual(str(Ip6Mask("/64")), "/64")
@@ -211,6 +216,11 @@ class TestIp6Mask(TestCase):
     def test_version(self):
         self.assertEqual(Ip6Mask("/0").version, 6)
 
+    def test_copy(self):
+        self.assertEqual(copy.copy(Ip6Mask("/64")), Ip6Mask("/64"))
+        self.assertEqual(copy.deepcopy(Ip6Mask("/64")), Ip6Mask("/64"))
+        self.assertEqual(copy.deepcopy(Ip6Mask("/64")).version, 6)
+
 
 class TestIp6Network(TestCase):
     def test___init__(self):
@@ -226,7 +236,9 @@ class TestIp6Network(TestCase):
         self.assertEqual(Ip6Network("1234:5678:90ab:cdef::/0")._mask, Ip6Mask("/0"))
         self.assertRaises(Ip6NetworkFormatError, Ip6Network, "1234:5678:90ab:cdef:://64")
         self.assertRaises(Ip6NetworkFormatError, Ip6Network, "1234:5678:90ab:cdef::/6432")
+        self.assertEqual(Ip6Network("1234:5678:90ab:cdef::/064")._mask, Ip6Mask("/64"))
         self.assertRaises(Ip6NetworkFormatError, Ip6Network, "1234:5678:90ab:cdef::")
+        self.assertRaises(Ip6NetworkFormatError, Ip6Network, "1234:5678:90ab:cdef::/129")
 
     def test___str__(self):
         self.assertEqual(str(Ip6Network("1234:5678:90ab:cdef::/64")), "1234:5678:90ab:cdef::/64")
@@ -251,6 +263,7 @@ class TestIp6Network(TestCase):
 
     def test_mask(self):
         self.assertEqual(Ip6Network("1234:5678:90ab:cdef::/64").mask, Ip6Mask("/64"))
+        self.assertIs(Ip6Network("2001:db8::/64").mask, Ip6Mask("/64"))
 
     def test_last(self):
         self.assertEqual(Ip6Network("1234:5678:90ab:cdef::/64").last, Ip6Address("1234:5678:90ab:cdef:ffff:ffff:ffff:ffff"))
@@ -261,6 +274,10 @@ class TestIp6Network(TestCase):
     def test_version(self):
         self.assertEqual(Ip6Network("1234:5678:90ab:cdef::/64").version, 6)
 
+    def test_copy(self):
+        self.assertEqual(copy.copy(Ip6Network("2001::/64")), Ip6Network("2001::/64"))
+        self.assertEqual(copy.deepcopy(Ip6Network("2001::/64")), Ip6Network("2001::/64"))
+
 
 class TestIp6Host(TestCase):
     def test___init__(self):
@@ -301,3 +318,7 @@ class TestIp6Host(TestCase):
 
     def test_version(self):
         self.assertEqual(Ip6Host("::/128").version, 6)
+
+    def test_copy(self):
+        self.assertEqual(copy.copy(Ip6Host("2001::7/64")), Ip6Host("2001::7/64"))
+        self.assertEqual(copy.deepcopy(Ip6Host("2001::7/64")), Ip6Host("2001::7/64"))
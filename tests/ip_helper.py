@@ -55,6 +55,7 @@ class TestIpHelper(TestCase):
             Sample(b"\x00" * 1500, 0xF3FF, 0x0C00),
             Sample(b"\xF7\x24\x09" * 100 + b"\x35\x67\x0F\x00" * 250, 0x7314, 0x7ED1),
             Sample(b"\x07" * 9999, 0xA3DC, 0x1AE9),
+            Sample(b"\xFF", 0xD5462BB9, 0xFFFE),
         ]
 
         for sample in samples:
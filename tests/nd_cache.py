@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+
+############################################################################
+#                                                                          #
+#  PyTCP - Python TCP/IP stack                                             #
+#  Copyright (C) 2020-2021  Sebastian Majewski                             #
+#                                                                          #
+#  This program is free software: you can redistribute it and/or modify    #
+#  it under the terms of the GNU General Public License as published by    #
+#  the Free Software Foundation, either version 3 of the License, or       #
+#  (at your option) any later version.                                     #
+#                                                                          #
+#  This program is distributed in the hope that it will be useful,         #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of          #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the           #
+#  GNU General Public License for more details.                            #
+#                                                                          #
+#  You should have received a copy of the GNU General Public License       #
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.  #
+#                                                                          #
+#  Author's email: ccie18643@gmail.com                                     #
+#  Github repository: https://github.com/ccie18643/PyTCP                   #
+#                                                                          #
+############################################################################
+
+
+#
+# tests/nd_cache.py - unit tests for NdCache class
+#
+
+
+from testslide import StrictMock, TestCase
+
+from pytcp.lib.ip6_address import Ip6Address, Ip6Host
+from pytcp.lib.mac_address import MacAddress
+from pytcp.subsystems.nd_cache import NdCache
+from pytcp.subsystems.packet_handler import PacketHandler
+from pytcp.subsystems.timer import Timer
+
+
+class TestNdCache(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.patch_attribute("pytcp.subsystems.nd_cache.config", "LOG_CHANEL", set())
+        self.patch_attribute("pytcp.subsystems.nd_cache.config", "ND_CACHE_ENTRY_MAX_AGE", 3600)
+        self.patch_attribute("pytcp.subsystems.nd_cache.config", "ND_CACHE_ENTRY_REFRESH_TIME", 300)
+        self.patch_attribute("pytcp.subsystems.nd_cache.config", "ND_CACHE_NS_HOLD_TIME", 1)
+
+        # Clock is advanced by tests, timer only records registered tasks so tests can run them by hand
+        self.now = 1000.0
+        self.mock_callable("pytcp.subsystems.nd_cache.time", "monotonic").with_implementation(lambda: self.now)
+        self.timer_tasks = []
+        self.timer_mock = StrictMock(template=Timer)
+        self.mock_callable(self.timer_mock, "register_method").with_implementation(lambda **kwargs: self.timer_tasks.append(kwargs))
+
+        self.mock_callable("pytcp.subsystems.packet_handler", "log").to_return_value(None)
+        self.packet_handler = PacketHandler(None)
+        self.packet_handler.ip6_host = [Ip6Host("2001:db8:0:1::7/64")]
+        self.ns_sent = []
+        self.mock_callable(self.packet_handler, "_phtx_icmp6", allow_private=True).with_implementation(
+            lambda **kwargs: self.ns_sent.append(kwargs["icmp6_ns_target_address"])
+        )
+
+        self.stack_mock = StrictMock()
+        self.stack_mock.timer = self.timer_mock
+        self.stack_mock.packet_handler = self.packet_handler
+        self.patch_attribute("pytcp.subsystems.nd_cache", "stack", self.stack_mock)
+
+        self.ip6_address = Ip6Address("2001:db8:0:1::91")
+        self.mac_address = MacAddress("02:00:00:00:00:91")
+        self.nd_cache = NdCache()
+
+    def _run_maintainer(self):
+        """Run pending one-shot maintainer task, check it registered exactly one follow-up task and return its delay"""
+
+        self.assertEqual(len(self.timer_tasks), 1)
+        self.timer_tasks.pop()["method"]()
+        self.assertEqual(len(self.timer_tasks), 1)
+        self.assertEqual(self.timer_tasks[0]["repeat_count"], 0)
+        return self.timer_tasks[0]["delay"]
+
+    def test_maintainer_chain(self):
+        self.assertEqual(self.timer_tasks[0]["delay"], 60_000)
+        self.assertEqual(self._run_maintainer(), 60_000)
+        self.nd_cache.add_entry(self.ip6_address, self.mac_address)
+        self.assertEqual(self._run_maintainer(), 60_000)
+        self.now += 3300 - 30
+        self.assertEqual(self._run_maintainer(), 30_000)
+        self.now += 30
+        self.assertEqual(self._run_maintainer(), 1000)
+
+    def test_add_entry(self):
+        self.nd_cache.add_entry(self.ip6_address, self.mac_address)
+        self.assertEqual(self.nd_cache.find_entry(self.ip6_address), self.mac_address)
+        self.assertEqual(self.ns_sent, [])
+
+    def test_add_entry__refresh_keeps_single_heap_item(self):
+        for _ in range(1000):
+            self.nd_cache.add_entry(self.ip6_address, MacAddress("02:00:00:00:00:92"))
+            self.now += 1
+        self.nd_cache.add_entry(self.ip6_address, self.mac_address)
+        self.assertEqual(len(self.nd_cache._maintain_heap), 1)
+        self.assertEqual(self.nd_cache.find_entry(self.ip6_address), self.mac_address)
+
+    def test_maintain_cache__refreshed_entry_item_moved(self):
+        self.nd_cache.add_entry(self.ip6_address, self.mac_address)
+        self.now += 3000
+        self.nd_cache.add_entry(self.ip6_address, self.mac_address)
+        self.now += 300
+        self._run_maintainer()
+        self.assertEqual(self.nd_cache._maintain_heap[0][0], self.now + 3000)
+        self.assertEqual(len(self.nd_cache._maintain_heap), 1)
+
+    def test_maintain_cache__expire(self):
+        self.nd_cache.add_entry(self.ip6_address, self.mac_address)
+        self.now += 3601
+        self._run_maintainer()
+        self.assertEqual(self.nd_cache._mac_address, {})
+        self.assertEqual(self.nd_cache._maintain_heap, [])
+        self.assertEqual(self.ns_sent, [])
+
+    def test_maintain_cache__refresh_on_hit(self):
+        self.nd_cache.add_entry(self.ip6_address, self.mac_address)
+        self.nd_cache.find_entry(self.ip6_address)
+        self.now += 3300
+        self._run_maintainer()
+        self.assertEqual(self.ns_sent, [self.ip6_address])
+
+        # Entry not used again since the solicitation, no further solicitations are sent while it is checked every second
+        self.now += 1
+        self._run_maintainer()
+        self.assertEqual(self.ns_sent, [self.ip6_address])
+
+        # Reply refreshes the entry
+        self.nd_cache.add_entry(self.ip6_address, self.mac_address)
+        self.now += 1
+        self._run_maintainer()
+        self.assertEqual(self.nd_cache.find_entry(self.ip6_address), self.mac_address)
+        self.assertEqual(self.nd_cache._maintain_heap[0][0], self.now - 1 + 3300)
+
+    def test_maintain_cache__no_refresh_without_hit(self):
+        self.nd_cache.add_entry(self.ip6_address, self.mac_address)
+        self.now += 3300
+        self._run_maintainer()
+        self.assertEqual(self.ns_sent, [])
+        self.now += 301
+        self._run_maintainer()
+        self.assertEqual(self.nd_cache._mac_address, {})
+
+    def test_find_entry__solicitation_coalesced(self):
+        self.assertIsNone(self.nd_cache.find_entry(self.ip6_address))
+        self.now += 0.5
+        self.assertIsNone(self.nd_cache.find_entry(self.ip6_address))
+        self.assertEqual(self.ns_sent, [self.ip6_address])
+
+    def test_find_entry__solicitation_after_hold_time(self):
+        self.nd_cache.find_entry(self.ip6_address)
+        self.now += 1
+        self.nd_cache.find_entry(self.ip6_address)
+        self.assertEqual(self.ns_sent, [self.ip6_address, self.ip6_address])
+
+    def test_find_entry__solicitation_after_add_entry(self):
+        self.nd_cache.find_entry(self.ip6_address)
+        self.nd_cache.add_entry(self.ip6_address, self.mac_address)
+        self.assertEqual(self.nd_cache._pending_ns, {})
+        self.nd_cache._send_icmp6_neighbor_solicitation(self.ip6_address)
+        self.assertEqual(self.ns_sent, [self.ip6_address, self.ip6_address])
+
+    def test_find_entry__solicitation_per_target(self):
+        self.nd_cache.find_entry(self.ip6_address)
+        self.nd_cache.find_entry(Ip6Address("2001:db8:0:1::92"))
+        self.assertEqual(self.ns_sent, [self.ip6_address, Ip6Address("2001:db8:0:1::92")])
+
+    def test_maintain_cache__pending_solicitations_purged(self):
+        self.nd_cache.find_entry(self.ip6_address)
+        self.now += 1
+        self._run_maintainer()
+        self.assertEqual(self.nd_cache._pending_ns, {})